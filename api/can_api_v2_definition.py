@@ -89,14 +89,20 @@ class Metrics(base_model.APIBaseModel):
     @staticmethod
     def empty():
         """Returns an empty Metrics object."""
-        return Metrics(
-            testPositivityRatio=None,
-            caseDensity=None,
-            contactTracerCapacityRatio=None,
-            infectionRate=None,
-            infectionRateCI90=None,
-            icuHeadroomRatio=None,
-        )
+        return _EMPTY_METRICS
+
+
+# All-None metrics are requested once per region without metrics data, so build
+# the instance a single time at import and share it; validation runs once here
+# instead of per call.
+_EMPTY_METRICS = Metrics(
+    testPositivityRatio=None,
+    caseDensity=None,
+    contactTracerCapacityRatio=None,
+    infectionRate=None,
+    infectionRateCI90=None,
+    icuHeadroomRatio=None,
+)
 
 
 @enum.unique
@@ -172,6 +178,9 @@ class RegionSummary(base_model.APIBaseModel):
     lastUpdatedDate: datetime.date = pydantic.Field(..., description="Date of latest data")
 
 
+_REGION_SUMMARY_FIELDS = frozenset(RegionSummary.__fields__)
+
+
 class RegionSummaryWithTimeseries(RegionSummary):
     """Summary data for a region with prediction timeseries data and actual timeseries data."""
 
@@ -180,16 +189,11 @@ class RegionSummaryWithTimeseries(RegionSummary):
 
     @property
     def region_summary(self) -> RegionSummary:
-
-        data = {}
         # Iterating through self does not force any conversion
         # https://pydantic-docs.helpmanual.io/usage/exporting_models/#dictmodel-and-iteration
-        for field, value in self:
-            if field not in RegionSummary.__fields__:
-                continue
-            data[field] = value
-
-        return RegionSummary(**data)
+        data = {field: value for field, value in self if field in _REGION_SUMMARY_FIELDS}
+        # The values come from an already validated model, so skip re-validating them.
+        return RegionSummary.construct(**data)
 
 
 class AggregateRegionSummary(base_model.APIBaseModel):
@@ -197,12 +201,24 @@ class AggregateRegionSummary(base_model.APIBaseModel):
 
     __root__: List[RegionSummary] = pydantic.Field(...)
 
+    @classmethod
+    def from_trusted(cls, items: List[RegionSummary]) -> "AggregateRegionSummary":
+        """Wraps already validated summaries without re-running validators on each one."""
+        return cls.construct(__root__=items)
+
 
 class AggregateRegionSummaryWithTimeseries(base_model.APIBaseModel):
     """Timeseries and summary data for multiple regions."""
 
     __root__: List[RegionSummaryWithTimeseries] = pydantic.Field(...)
 
+    @classmethod
+    def from_trusted(
+        cls, items: List[RegionSummaryWithTimeseries]
+    ) -> "AggregateRegionSummaryWithTimeseries":
+        """Wraps already validated timeseries without re-running validators on each one."""
+        return cls.construct(__root__=items)
+
 
 class RegionTimeseriesRowWithHeader(base_model.APIBaseModel):
     """Prediction timeseries row with location information."""
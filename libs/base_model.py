@@ -1,5 +1,7 @@
+import orjson
 import pydantic
 import simplejson
+from pydantic.json import pydantic_encoder
 
 
 def _nan_safe_json_dumps(*args, **kwargs):
@@ -9,7 +11,41 @@ def _nan_safe_json_dumps(*args, **kwargs):
 class APIBaseModel(pydantic.BaseModel):
     """Base model for API output."""
 
+    @classmethod
+    def construct(cls, _fields_set=None, **values):
+        """construct() with serialized key order matching validated instances.
+
+        pydantic v1 builds the instance __dict__ as {**defaults, **values}, which moves
+        defaulted fields ahead of their declared position and so reorders keys in
+        .dict()/.json() output (including the header of CSVs derived from the first
+        row). Rebuild the __dict__ in field declaration order.
+        """
+        m = super().construct(_fields_set=_fields_set, **values)
+        ordered = {name: m.__dict__[name] for name in cls.__fields__ if name in m.__dict__}
+        ordered.update({key: value for key, value in m.__dict__.items() if key not in ordered})
+        object.__setattr__(m, "__dict__", ordered)
+        return m
+
+    def json_compact_bytes(self) -> bytes:
+        """Serializes the model to compact JSON bytes on a single fast path.
+
+        orjson encodes the exported dict natively (dates included) and writes NaN
+        as null like `_nan_safe_json_dumps` does; `.json()` keeps the stdlib
+        formatting for callers that depend on it.
+        """
+        data = self.dict()
+        # Like .json(), serialize custom-root models as their root value rather than
+        # the {"__root__": ...} wrapper that .dict() returns.
+        if self.__custom_root_type__:
+            data = data["__root__"]
+        return orjson.dumps(data, default=pydantic_encoder)
+
     class Config:
+        # Note: pydantic v1 builds each model's validators eagerly at class
+        # definition time and has no way to defer that work; v2's
+        # `defer_build` config would let rarely-used API models skip
+        # validator/serializer construction until first use. Revisit when
+        # upgrading pydantic.
         json_dumps = _nan_safe_json_dumps
 
         @staticmethod
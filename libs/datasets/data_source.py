@@ -7,7 +7,6 @@ from covidactnow.datapublic.common_fields import CommonFields
 from libs.datasets.timeseries import TimeseriesDataset
 from libs.datasets.latest_values_dataset import LatestValuesDataset
 from libs.datasets.dataset_utils import AggregationLevel
-from functools import lru_cache
 
 
 class DataSource(object):
@@ -34,6 +33,11 @@ class DataSource(object):
     # assumptions about missing vs data that is just zero.
     FILL_MISSING_STATE_LEVEL_DATA = True
 
+    # Built datasets memoized on the instance rather than with lru_cache, which keys its
+    # global cache on self and would keep every source (and its DataFrame) alive forever.
+    _timeseries: Optional[TimeseriesDataset] = None
+    _latest_values: Optional[LatestValuesDataset] = None
+
     def __init__(self, data: pd.DataFrame, provenance: Optional[pd.Series] = None):
         self.data = data
         self.provenance = provenance
@@ -58,37 +62,42 @@ class DataSource(object):
         """
         raise NotImplementedError("Subclass must implement")
 
-    @lru_cache(None)
     def beds(self) -> LatestValuesDataset:
         """Builds generic beds dataset"""
         return self.latest_values()
 
-    @lru_cache(None)
     def population(self) -> LatestValuesDataset:
         """Builds generic beds dataset"""
         return self.latest_values()
 
-    @lru_cache(None)
     def timeseries(self) -> TimeseriesDataset:
         """Build TimeseriesDataset from this data source."""
+        if self._timeseries is not None:
+            return self._timeseries
+
         if set(self.INDEX_FIELD_MAP.keys()) != set(TimeseriesDataset.INDEX_FIELDS):
             raise ValueError("Index fields must match")
 
-        return TimeseriesDataset.from_source(
+        self._timeseries = TimeseriesDataset.from_source(
             self, fill_missing_state=self.FILL_MISSING_STATE_LEVEL_DATA
         )
+        return self._timeseries
 
-    @lru_cache(None)
     def latest_values(self) -> LatestValuesDataset:
+        if self._latest_values is not None:
+            return self._latest_values
+
         if set(self.INDEX_FIELD_MAP.keys()) == set(TimeseriesDataset.INDEX_FIELDS):
-            return self.timeseries().latest_values_object()
+            self._latest_values = self.timeseries().latest_values_object()
+            return self._latest_values
 
         if set(self.INDEX_FIELD_MAP.keys()) != set(LatestValuesDataset.INDEX_FIELDS):
             raise ValueError("Index fields must match")
 
-        return LatestValuesDataset.from_source(
+        self._latest_values = LatestValuesDataset.from_source(
             self, fill_missing_state=self.FILL_MISSING_STATE_LEVEL_DATA
         )
+        return self._latest_values
 
     @classmethod
     def _rename_to_common_fields(cls: Type["DataSource"], df: pd.DataFrame) -> pd.DataFrame:
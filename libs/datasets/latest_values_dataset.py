@@ -63,7 +63,7 @@ class LatestValuesDataset(dataset_base.DatasetBase):
 
         # Add state fips
         is_state = data[CommonFields.AGGREGATE_LEVEL] == AggregationLevel.STATE.value
-        state_fips = data.loc[is_state, CommonFields.STATE].map(us_state_abbrev.ABBREV_US_FIPS)
+        state_fips = us_state_abbrev.abbrev_to_fips_series(data.loc[is_state, CommonFields.STATE])
         data.loc[is_state, CommonFields.FIPS] = state_fips
 
         data = cls._calculate_puerto_rico_bed_occupancy_rate(data)
@@ -2,6 +2,7 @@ from typing import Optional, Iterable
 import pathlib
 import datetime
 
+import numpy as np
 import pandas as pd
 
 from libs.datasets import can_model_output_schema as schema
@@ -16,9 +17,10 @@ def get_can_projection_path(input_dir, fips, intervention) -> pathlib.Path:
 
 
 def _calculate_shortfall(beds: pd.Series, hospitalized: pd.Series) -> pd.Series:
-    shortfall = hospitalized - beds
-    shortfall[shortfall > 0] = 0
-    return shortfall.abs()
+    """Returns the number of hospitalizations exceeding bed capacity, 0 where capacity holds."""
+    return pd.Series(
+        np.maximum(hospitalized.to_numpy() - beds.to_numpy(), 0), index=hospitalized.index
+    )
 
 
 class CANPyseirLocationOutput(object):
@@ -30,11 +32,13 @@ class CANPyseirLocationOutput(object):
         self.intervention = Intervention(data[schema.INTERVENTION].iloc[0])
 
         self.data["short_fall"] = _calculate_shortfall(
-            self.data[schema.ALL_HOSPITALIZED], self.data[schema.BEDS]
+            self.data[schema.BEDS], self.data[schema.ALL_HOSPITALIZED]
         )
 
     @classmethod
     def load_from_path(cls, path):
+        # Passing the dtype mapping here keeps all casting inside the single read_json call
+        # rather than per-column astype passes afterwards.
         data = pd.read_json(
             path,
             convert_dates=[schema.DATE],
@@ -4,7 +4,11 @@ import pandas as pd
 from covidactnow.datapublic.common_fields import CommonFields
 from libs.datasets import dataset_utils
 from libs.datasets import data_source
-from libs.us_state_abbrev import US_STATE_ABBREV, ABBREV_US_FIPS, ABBREV_US_UNKNOWN_COUNTY_FIPS
+from libs.us_state_abbrev import (
+    US_STATE_ABBREV,
+    ABBREV_US_UNKNOWN_COUNTY_FIPS,
+    abbrev_to_fips_series,
+)
 from libs.datasets.dataset_utils import AggregationLevel
 from libs.datasets.common_fields import CommonIndexFields
 
@@ -83,7 +87,9 @@ class FIPSPopulation(data_source.DataSource):
             AggregationLevel.COUNTY,
             AggregationLevel.STATE,
         ).reset_index()
-        states_aggregated[cls.Fields.FIPS] = states_aggregated[cls.Fields.STATE].map(ABBREV_US_FIPS)
+        states_aggregated[cls.Fields.FIPS] = abbrev_to_fips_series(
+            states_aggregated[cls.Fields.STATE]
+        )
         states_aggregated[cls.Fields.COUNTY] = None
 
         common_fields_data = cls._rename_to_common_fields(pd.concat([data, states_aggregated]))
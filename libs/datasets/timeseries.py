@@ -282,7 +282,7 @@ class TimeseriesDataset(dataset_base.DatasetBase):
         fips_data = dataset_utils.build_fips_data_frame()
         data = dataset_utils.add_county_using_fips(data, fips_data)
         is_state = data[CommonFields.AGGREGATE_LEVEL] == AggregationLevel.STATE.value
-        state_fips = data.loc[is_state, CommonFields.STATE].map(us_state_abbrev.ABBREV_US_FIPS)
+        state_fips = us_state_abbrev.abbrev_to_fips_series(data.loc[is_state, CommonFields.STATE])
         data.loc[is_state, CommonFields.FIPS] = state_fips
 
         no_fips = data[CommonFields.FIPS].isnull()
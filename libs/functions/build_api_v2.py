@@ -92,6 +92,8 @@ def build_bulk_flattened_timeseries(
     for region_timeseries in bulk_timeseries.__root__:
         # Iterate through each state or county in data, adding summary data to each
         # timeseries row.
+        # RegionTimeseriesRowWithHeader has no lastUpdatedDate field, so that value is not
+        # carried over from the region summary.
         summary_data = {
             "country": region_timeseries.country,
             "county": region_timeseries.county,
@@ -99,19 +101,19 @@ def build_bulk_flattened_timeseries(
             "fips": region_timeseries.fips,
             "lat": region_timeseries.lat,
             "long": region_timeseries.long,
-            "lastUpdatedDate": datetime.utcnow(),
         }
         actuals_by_date = {row.date: row for row in region_timeseries.actualsTimeseries}
         metrics_by_date = {row.date: row for row in region_timeseries.metricsTimeseries}
         dates = sorted({*metrics_by_date.keys(), *actuals_by_date.keys()})
         for date in dates:
-            data = {
-                "date": date,
-                "actuals": actuals_by_date.get(date),
-                "metrics": metrics_by_date.get(date),
-            }
-            data.update(summary_data)
-            row = RegionTimeseriesRowWithHeader(**data)
+            # One row is built per region-day and every value comes from an already
+            # validated model, so skip re-running the row validators.
+            row = RegionTimeseriesRowWithHeader.construct(
+                date=date,
+                actuals=actuals_by_date.get(date),
+                metrics=metrics_by_date.get(date),
+                **summary_data,
+            )
             rows.append(row)
 
     return AggregateFlattenedTimeseries(__root__=rows)
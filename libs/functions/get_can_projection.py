@@ -1,12 +1,53 @@
+import functools
+import pathlib
+import re
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from libs.enums import Intervention
-import functools
+
+INTERVENTIONS_URL = "https://raw.githubusercontent.com/covid-projections/covid-data-public/master/data/misc/interventions.json"
+
+_CACHE_DIR = pathlib.Path.home() / ".cache" / "covid-data-model"
+
+# Shared session so repeated calls reuse one TCP/TLS connection instead of
+# paying a fresh handshake each time; retries cover transient GitHub errors.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+
+
+def _interventions_cache_path(etag: str) -> pathlib.Path:
+    return _CACHE_DIR / f"interventions-{re.sub(r'[^A-Za-z0-9]', '', etag)}.json"
 
 
 @functools.lru_cache(None)
 def get_interventions():
-    interventions_url = "https://raw.githubusercontent.com/covid-projections/covid-data-public/master/data/misc/interventions.json"
-    interventions = requests.get(interventions_url).json()
+    # lru_cache only helps within one process; key an on-disk copy by the upstream ETag so
+    # repeat CLI invocations skip the download while a new snapshot still invalidates it.
+    try:
+        etag = _SESSION.head(INTERVENTIONS_URL, timeout=10).headers.get("ETag", "")
+    except requests.RequestException:
+        etag = ""
+    cache_path = _interventions_cache_path(etag) if etag else None
+    if cache_path and cache_path.exists():
+        return orjson.loads(cache_path.read_bytes())
+
+    content = _SESSION.get(INTERVENTIONS_URL, timeout=10).content
+    interventions = orjson.loads(content)
+    if cache_path:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A new upstream snapshot means a new ETag; drop superseded copies so the
+        # cache directory holds at most one snapshot.
+        for stale_path in _CACHE_DIR.glob("interventions-*.json"):
+            if stale_path != cache_path:
+                try:
+                    stale_path.unlink()
+                except OSError:
+                    pass
+        cache_path.write_bytes(content)
     return interventions
 
 
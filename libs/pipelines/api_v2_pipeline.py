@@ -14,6 +14,7 @@ from api.can_api_v2_definition import AggregateRegionSummaryWithTimeseries
 from api.can_api_v2_definition import Metrics
 from api.can_api_v2_definition import MetricsTimeseriesRow
 from api.can_api_v2_definition import RegionSummaryWithTimeseries
+from libs import base_model
 from libs import dataset_deployer
 from libs import top_level_metrics
 from libs import top_level_metric_risk_levels
@@ -201,7 +202,7 @@ def deploy_single_level(
         output_path = path_builder.single_timeseries(timeseries, FileType.JSON)
         deploy_json_api_output(timeseries, output_path)
 
-    bulk_timeseries = AggregateRegionSummaryWithTimeseries(__root__=all_timeseries)
+    bulk_timeseries = AggregateRegionSummaryWithTimeseries.from_trusted(all_timeseries)
     start = time.time()
     flattened_timeseries = build_api_v2.build_bulk_flattened_timeseries(bulk_timeseries)
     duration = time.time() - start
@@ -216,7 +217,7 @@ def deploy_single_level(
     output_path = path_builder.bulk_timeseries(bulk_timeseries, FileType.JSON)
     deploy_json_api_output(bulk_timeseries, output_path)
 
-    bulk_summaries = AggregateRegionSummary(__root__=all_summaries)
+    bulk_summaries = AggregateRegionSummary.from_trusted(all_summaries)
     output_path = path_builder.bulk_summary(bulk_summaries, FileType.JSON)
     deploy_json_api_output(bulk_summaries, output_path)
 
@@ -224,8 +225,10 @@ def deploy_single_level(
     deploy_csv_api_output(bulk_summaries, output_path)
 
 
-def deploy_json_api_output(region_result: pydantic.BaseModel, output_path: pathlib.Path,) -> None:
-    output_path.write_text(region_result.json())
+def deploy_json_api_output(
+    region_result: base_model.APIBaseModel, output_path: pathlib.Path,
+) -> None:
+    output_path.write_bytes(region_result.json_compact_bytes())
 
 
 def deploy_csv_api_output(
@@ -4,6 +4,7 @@ from itertools import chain
 from typing import Sequence
 import structlog
 
+import numpy as np
 import pandas as pd
 
 from covidactnow.datapublic.common_fields import CommonFields, FieldName
@@ -63,6 +64,18 @@ TEST_POSITIVITY_METHODS = (
     ),
 )
 
+# Values derived from TEST_POSITIVITY_METHODS, precomputed once for the common case where
+# AllMethods.run is called with the default methods.
+_DEFAULT_METHOD_NAMES = tuple(method.name for method in TEST_POSITIVITY_METHODS)
+_DEFAULT_METHOD_CAT_TYPE = pd.CategoricalDtype(categories=_DEFAULT_METHOD_NAMES, ordered=True)
+_DEFAULT_TS_VALUE_COLS = sorted(
+    set(
+        chain.from_iterable(
+            (method.numerator, method.denominator) for method in TEST_POSITIVITY_METHODS
+        )
+    )
+)
+
 
 @dataclasses.dataclass
 class AllMethods:
@@ -81,9 +94,20 @@ class AllMethods:
         diff_days: int = 7,
         recent_days: int = 14,
     ) -> "AllMethods":
-        ts_value_cols = list(
-            set(chain.from_iterable((method.numerator, method.denominator) for method in methods))
-        )
+        if methods is TEST_POSITIVITY_METHODS:
+            ts_value_cols = _DEFAULT_TS_VALUE_COLS
+            method_cat_type = _DEFAULT_METHOD_CAT_TYPE
+        else:
+            ts_value_cols = sorted(
+                set(
+                    chain.from_iterable(
+                        (method.numerator, method.denominator) for method in methods
+                    )
+                )
+            )
+            method_cat_type = pd.CategoricalDtype(
+                categories=[method.name for method in methods], ordered=True
+            )
         missing_columns = set(ts_value_cols) - set(metrics_in.data.columns)
         if missing_columns:
             raise AssertionError(f"Data missing for test positivity: {missing_columns}")
@@ -98,28 +122,60 @@ class AllMethods:
         recent_date_range = pd.date_range(end=end_date, periods=recent_days).intersection(
             input_date_range
         )
-        input_wide = (
-            input_long.unstack(CommonFields.DATE)
-            .reindex(columns=input_date_range)
-            .rename_axis(columns=CommonFields.DATE)
+        location_ids = (
+            input_long.index.get_level_values(CommonFields.LOCATION_ID).unique().sort_values()
+        )
+        # The cube view below needs the full (variable, location) x date grid; the diff over a
+        # fixed number of columns is only a diff over days when the date axis has no gaps. Skip
+        # the reindex (which copies the whole frame) when unstack already produced that grid,
+        # the common case for our daily input data.
+        full_var_loc_index = pd.MultiIndex.from_product(
+            [ts_value_cols, location_ids], names=[PdFields.VARIABLE, CommonFields.LOCATION_ID],
         )
+        input_wide = input_long.unstack(CommonFields.DATE)
+        if not (
+            input_wide.index.equals(full_var_loc_index)
+            and input_wide.columns.equals(input_date_range)
+        ):
+            input_wide = input_wide.reindex(index=full_var_loc_index, columns=input_date_range)
+        input_wide = input_wide.rename_axis(columns=CommonFields.DATE)
         # This calculates the difference only when the cumulative value is a real value `diff_days` apart.
         # It looks like our input data has few or no holes so this works well enough.
-        diff_df = input_wide.diff(periods=diff_days, axis=1)
-
-        all_wide = (
-            pd.concat(
-                {method.name: method.calculate(diff_df) for method in methods},
-                names=[PdFields.VARIABLE],
-            )
-            .reorder_levels([CommonFields.LOCATION_ID, PdFields.VARIABLE])
-            # Drop empty timeseries
-            .dropna("index", "all")
-            .sort_index()
+        # The shifted subtraction on the raw value buffer is equivalent to
+        # `input_wide.diff(periods=diff_days, axis=1)` without materializing a second frame.
+        values = input_wide.to_numpy(dtype=np.float64)
+        diffs = np.full_like(values, np.nan)
+        diffs[:, diff_days:] = values[:, diff_days:] - values[:, :-diff_days]
+
+        # Compute every method's ratio in one vectorized divide instead of N pairs of MultiIndex
+        # lookups and alignments. Axis order of the cube is (variable, location, date). A thread
+        # pool over methods was considered instead, but a single broadcast over the cube already
+        # does all methods in one C-level pass, so there is no per-method work left to dispatch.
+        cube = diffs.reshape(len(ts_value_cols), len(location_ids), -1)
+        variable_position = {variable: i for i, variable in enumerate(ts_value_cols)}
+        numerator_idx = [variable_position[method.numerator] for method in methods]
+        denominator_idx = [variable_position[method.denominator] for method in methods]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = cube[numerator_idx] / cube[denominator_idx]
+
+        # Find non-empty timeseries in the cube and assemble only those rows, already sorted by
+        # (location, method name). This replaces a dropna and sort_index over the full frame.
+        method_names = np.array([method.name for method in methods], dtype=object)
+        location_id_values = location_ids.to_numpy()
+        valid = ~np.isnan(ratios).all(axis=-1)
+        valid_method_idx, valid_location_idx = valid.nonzero()
+        order = np.lexsort(
+            (method_names[valid_method_idx], location_id_values[valid_location_idx])
         )
-
-        method_cat_type = pd.CategoricalDtype(
-            categories=[method.name for method in methods], ordered=True
+        valid_method_idx = valid_method_idx[order]
+        valid_location_idx = valid_location_idx[order]
+        all_wide = pd.DataFrame(
+            ratios[valid_method_idx, valid_location_idx],
+            index=pd.MultiIndex.from_arrays(
+                [location_id_values[valid_location_idx], method_names[valid_method_idx]],
+                names=[CommonFields.LOCATION_ID, PdFields.VARIABLE],
+            ),
+            columns=input_wide.columns,
         )
 
         has_recent_data = all_wide.loc[:, recent_date_range].notna().any(axis=1)
@@ -143,6 +199,12 @@ class AllMethods:
         return AllMethods(all_methods_timeseries=all_wide, test_positivity=test_positivity)
 
     def write(self, csv_path: pathlib.Path):
-        self.all_methods_timeseries.to_csv(
-            csv_path, date_format="%Y-%m-%d", index=True, float_format="%.05g",
+        # to_csv's float_format runs Python's % operator once per value; np.char.mod applies
+        # the same C format string to the whole buffer in one vectorized pass. NaNs become
+        # empty strings, matching the default na_rep.
+        df = self.all_methods_timeseries
+        values = df.to_numpy(dtype=np.float64)
+        formatted = np.where(np.isnan(values), "", np.char.mod("%.05g", values))
+        pd.DataFrame(formatted, index=df.index, columns=df.columns).to_csv(
+            csv_path, date_format="%Y-%m-%d", index=True,
         )
@@ -9,6 +9,9 @@
 # Roger Allen has waived all copyright and related or neighboring
 # rights to this code.
 
+import numpy as np
+import pandas as pd
+
 US_STATE_ABBREV = {
     "Alabama": "AL",
     "Alaska": "AK",
@@ -203,3 +206,20 @@ def is_unknown_county(fips: str) -> bool:
     Returns: True if unkown, false otherwise.
     """
     return len(fips) == 5 and fips.endswith("999")
+
+
+# Sorted abbreviation keys and their FIPS codes as arrays, used by abbrev_to_fips_series to
+# turn the per-element dict lookups of Series.map into one categorical codes lookup.
+_ABBREV_KEYS = np.array(sorted(ABBREV_US_FIPS))
+_ABBREV_FIPS_VALUES = np.array([ABBREV_US_FIPS[key] for key in _ABBREV_KEYS], dtype=object)
+
+
+def abbrev_to_fips_series(state: pd.Series) -> pd.Series:
+    """Vectorized equivalent of `state.map(ABBREV_US_FIPS)`.
+
+    Unrecognized abbreviations map to NaN, like Series.map.
+    """
+    codes = pd.Categorical(state, categories=_ABBREV_KEYS).codes
+    fips = _ABBREV_FIPS_VALUES[codes]
+    fips[codes == -1] = np.nan
+    return pd.Series(fips, index=state.index)
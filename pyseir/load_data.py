@@ -4,12 +4,12 @@ import urllib.request
 from typing import Optional
 from typing import Tuple
 
+import orjson
 import requests
 import re
 import io
 import us
 import zipfile
-import json
 from datetime import datetime
 from functools import lru_cache
 from enum import Enum
@@ -435,7 +435,8 @@ def load_contact_matrix_data_by_fips(fips):
     fips = [fips] if isinstance(fips, str) else list(fips)
     state_abbr = us.states.lookup(fips[0][:2]).abbr
     path = os.path.join(DATA_DIR, "contact_matrix", "contact_matrix_fips_%s.json" % state_abbr)
-    contact_matrix_data = json.loads(open(path).read())
+    with open(path, "rb") as f:
+        contact_matrix_data = orjson.loads(f.read())
     return {s: contact_matrix_data[s] for s in fips}
 
 
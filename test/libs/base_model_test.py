@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 import pydantic
 import numpy as np
 from libs import base_model
@@ -17,6 +17,19 @@ def test_custom_model_nans_serialize_properly():
     assert data.json() == expected
 
 
+def test_json_compact_bytes_unwraps_custom_root():
+    class Row(base_model.APIBaseModel):
+        val: float
+
+    class Rows(base_model.APIBaseModel):
+        __root__: List[Row]
+
+    data = Rows(__root__=[Row(val=1.5), Row(val=np.nan)])
+    # Custom-root models must serialize as their root value, like .json() does,
+    # and NaN must become null.
+    assert data.json_compact_bytes() == b'[{"val":1.5},{"val":null}]'
+
+
 def test_optional_field_modifies_schema_properly():
     class Bar(pydantic.BaseModel):
         val: int
@@ -4,6 +4,7 @@ import pytest
 
 from api.can_api_v2_definition import Actuals
 from api.can_api_v2_definition import RegionSummary
+from api.can_api_v2_definition import RegionTimeseriesRowWithHeader
 from libs import top_level_metric_risk_levels
 from libs.datasets import combined_datasets
 from libs.functions import build_api_v2
@@ -73,6 +74,34 @@ def test_build_summary_for_fips(
     assert expected.dict() == summary.dict()
 
 
+def test_flattened_timeseries_row_preserves_field_order():
+    # The bulk flattened CSV header is derived from the first row's dict, so
+    # construct() must keep keys in field declaration order.
+    row = RegionTimeseriesRowWithHeader.construct(
+        date=datetime.date(2020, 4, 1),
+        actuals=None,
+        metrics=None,
+        country="USA",
+        county=None,
+        state="NY",
+        fips="36061",
+        lat=None,
+        long=None,
+    )
+    expected_fields = [
+        "date",
+        "country",
+        "state",
+        "county",
+        "fips",
+        "lat",
+        "long",
+        "actuals",
+        "metrics",
+    ]
+    assert list(row.dict()) == expected_fields
+
+
 def test_generate_timeseries_for_fips(
     nyc_model_output_path, nyc_region, nyc_rt_dataset, nyc_icu_dataset
 ):
@@ -0,0 +1,82 @@
+import pytest
+import requests
+
+from libs.functions import get_can_projection
+
+
+class _FakeResponse:
+    def __init__(self, headers=None, content=b""):
+        self.headers = headers or {}
+        self.content = content
+
+
+class _FakeSession:
+    def __init__(self, etag=None, content=b"{}", head_exception=None):
+        self.etag = etag
+        self.content = content
+        self.head_exception = head_exception
+        self.get_calls = 0
+
+    def head(self, url, timeout=None):
+        if self.head_exception:
+            raise self.head_exception
+        headers = {"ETag": self.etag} if self.etag else {}
+        return _FakeResponse(headers=headers)
+
+    def get(self, url, timeout=None):
+        self.get_calls += 1
+        return _FakeResponse(content=self.content)
+
+
+@pytest.fixture
+def interventions_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_can_projection, "_CACHE_DIR", tmp_path)
+    get_can_projection.get_interventions.cache_clear()
+    yield tmp_path
+    get_can_projection.get_interventions.cache_clear()
+
+
+def test_cache_miss_downloads_and_hit_skips_download(monkeypatch, interventions_cache_dir):
+    session = _FakeSession(etag='"abc"', content=b'{"NY": "shelter_in_place"}')
+    monkeypatch.setattr(get_can_projection, "_SESSION", session)
+    assert get_can_projection.get_interventions() == {"NY": "shelter_in_place"}
+    assert session.get_calls == 1
+
+    # A fresh process (cleared lru_cache) seeing the same ETag reads from disk.
+    get_can_projection.get_interventions.cache_clear()
+    session = _FakeSession(etag='"abc"', content=b"unused")
+    monkeypatch.setattr(get_can_projection, "_SESSION", session)
+    assert get_can_projection.get_interventions() == {"NY": "shelter_in_place"}
+    assert session.get_calls == 0
+
+
+def test_new_etag_replaces_stale_cache_file(monkeypatch, interventions_cache_dir):
+    monkeypatch.setattr(
+        get_can_projection, "_SESSION", _FakeSession(etag='"old"', content=b'{"NY": "a"}')
+    )
+    get_can_projection.get_interventions()
+
+    get_can_projection.get_interventions.cache_clear()
+    monkeypatch.setattr(
+        get_can_projection, "_SESSION", _FakeSession(etag='"new"', content=b'{"NY": "b"}')
+    )
+    assert get_can_projection.get_interventions() == {"NY": "b"}
+    cache_files = [path.name for path in interventions_cache_dir.glob("interventions-*.json")]
+    assert cache_files == ["interventions-new.json"]
+
+
+def test_missing_etag_downloads_without_caching(monkeypatch, interventions_cache_dir):
+    session = _FakeSession(etag=None, content=b'{"NY": "a"}')
+    monkeypatch.setattr(get_can_projection, "_SESSION", session)
+    assert get_can_projection.get_interventions() == {"NY": "a"}
+    assert session.get_calls == 1
+    assert list(interventions_cache_dir.glob("interventions-*.json")) == []
+
+
+def test_head_failure_falls_back_to_download(monkeypatch, interventions_cache_dir):
+    session = _FakeSession(
+        etag='"abc"', content=b'{"NY": "a"}', head_exception=requests.ConnectionError("boom")
+    )
+    monkeypatch.setattr(get_can_projection, "_SESSION", session)
+    assert get_can_projection.get_interventions() == {"NY": "a"}
+    assert session.get_calls == 1
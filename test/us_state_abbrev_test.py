@@ -1,8 +1,12 @@
+import numpy as np
+import pandas as pd
+
 from libs.us_state_abbrev import (
     US_STATE_ABBREV,
     ABBREV_US_STATE,
     ABBREV_US_FIPS,
     ABBREV_US_UNKNOWN_COUNTY_FIPS,
+    abbrev_to_fips_series,
 )
 
 
@@ -15,3 +19,14 @@ def test_state_name_fips_abbrev_maps():
     assert 56 == len(US_STATE_ABBREV)
 
     assert ABBREV_US_UNKNOWN_COUNTY_FIPS["CA"] == "06999"
+
+
+def test_abbrev_to_fips_series():
+    states = pd.Series(["TX", "not-a-state", np.nan, "CA"], index=[10, 20, 30, 40])
+    fips = abbrev_to_fips_series(states)
+
+    # Known abbreviations map like ABBREV_US_FIPS; anything else becomes NaN,
+    # matching states.map(ABBREV_US_FIPS).
+    expected = pd.Series(["48", np.nan, np.nan, "06"], index=[10, 20, 30, 40])
+    pd.testing.assert_series_equal(fips, expected)
+    pd.testing.assert_series_equal(fips, states.map(ABBREV_US_FIPS))